@@ -0,0 +1,17 @@
+# cython: language_level=3, freethreading_compatible=True
+"""Cython fibonacci kernel that runs without holding the GIL.
+
+Build in place with: cythonize -i src/py_freethread/_cpu_bound_cy.pyx
+"""
+
+
+cdef long _fib(long n) noexcept nogil:
+    return n if n < 2 else _fib(n - 1) + _fib(n - 2)
+
+
+def fibonacci(long n):
+    """Compute the nth Fibonacci number by naive recursion in C, with the GIL released."""
+    cdef long result
+    with nogil:
+        result = _fib(n)
+    return result
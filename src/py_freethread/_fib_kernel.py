@@ -0,0 +1,13 @@
+"""Fibonacci kernel kept in its own module so it can be compiled ahead of time.
+
+Compile in place with mypyc (cd src && mypyc py_freethread/_fib_kernel.py) or Nuitka
+(python -m nuitka --module src/py_freethread/_fib_kernel.py --output-dir=src/py_freethread).
+The compiled extension takes precedence over this file on import.
+"""
+
+
+def fibonacci(n: int) -> int:
+    """Compute the nth Fibonacci number by naive recursion."""
+    if n <= 1:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
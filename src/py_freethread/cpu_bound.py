@@ -1,10 +1,25 @@
 #!/usr/bin/env python3
 """CPU-bound workload demo - compare threaded performance with/without GIL."""
 
+import ctypes
+import os
+import subprocess
 import sys
+import tempfile
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache
+
+try:
+    from . import _fib_kernel
+except ImportError:  # Run as a script, outside the package: "aot" falls back to fibonacci_naive
+    _fib_kernel = None
+
+try:
+    from ._cpu_bound_cy import fibonacci as fibonacci_cython
+except ImportError:  # Build with: cythonize -i src/py_freethread/_cpu_bound_cy.pyx
+    fibonacci_cython = None
 
 
 def main():
@@ -15,12 +30,26 @@ def main():
     gil_enabled = sys._is_gil_enabled()
     print(f"\nGIL enabled: {gil_enabled}")
     print(f"Python version: {sys.version}")
+    print(f"Fibonacci algorithm: {FIB_ALGO}")
+    if FIB_ALGO == "repeated":
+        print(f"Repetitions per task: {FIB_REPEAT:,}")
+    if FIB_ALGO == "aot":
+        compiled = _fib_kernel is not None and not _fib_kernel.__file__.endswith(".py")
+        print(f"AOT kernel compiled: {compiled}")
 
     # Define CPU-intensive tasks (adjust n based on your system)
     tasks = [35, 35, 35, 35]  # Four Fibonacci calculations
-    num_workers = 4
+    # One worker per available CPU (respects affinity/cgroup limits); extra threads would
+    # only contend for the same cores
+    num_cpus = os.process_cpu_count() or 1
+    num_workers = min(len(tasks), num_cpus)
 
     print(f"\nRunning {len(tasks)} tasks: {tasks}")
+    print(f"Available CPUs: {num_cpus}")
+    if len(tasks) > num_cpus:
+        print(f"⚠️  More tasks than CPUs - speedup is capped at {num_cpus}x")
+
+    warm_up(tasks)
 
     # Run sequential baseline
     sequential_time = run_sequential(tasks)
@@ -28,6 +57,10 @@ def main():
     # Run threaded version
     threaded_time = run_threaded(tasks, num_workers)
 
+    # With the GIL, processes are the way to get CPU parallelism
+    if gil_enabled:
+        process_time = run_multiprocess(tasks, num_workers)
+
     # Calculate speedup
     speedup = sequential_time / threaded_time
 
@@ -35,11 +68,20 @@ def main():
     print("Results:")
     print(f"  Sequential: {sequential_time:.3f}s")
     print(f"  Threaded:   {threaded_time:.3f}s")
+    if gil_enabled:
+        print(f"  Processes:  {process_time:.3f}s")
     print(f"  Speedup:    {speedup:.2f}x")
 
-    if gil_enabled:
+    if num_workers == 1:
+        print("\n⚠️  Only one CPU available - parallel speedup cannot be measured")
+    elif gil_enabled and FIB_ALGO in GIL_RELEASING_ALGORITHMS:
+        print(f"\n✓  GIL is ENABLED, but the {FIB_ALGO} kernel releases it while computing")
+        print(f"   Threads can execute in parallel: {speedup:.2f}x with {num_workers} workers")
+        print(f"   (a process pool gets {sequential_time / process_time:.2f}x)")
+    elif gil_enabled:
         print("\n⚠️  GIL is ENABLED - threads cannot execute CPU-bound code in parallel")
         print("   Speedup is limited by the GIL")
+        print(f"   A process pool gets {sequential_time / process_time:.2f}x instead")
     else:
         print("\n✓  GIL is DISABLED - threads can execute in parallel!")
         print(f"   Achieved {speedup:.2f}x speedup with {num_workers} workers")
@@ -50,12 +92,10 @@ def run_sequential(tasks: list[int]) -> float:
     print("\n=== Sequential Execution ===")
     start = time.perf_counter()
 
-    for i, n in enumerate(tasks):
-        task_id, result, duration = cpu_intensive_task(i, n)
-        print(f"Task {task_id}: fib({n}) = {result} (took {duration:.3f}s)")
+    results = [cpu_intensive_task(i, n) for i, n in enumerate(tasks)]
 
     total_time = time.perf_counter() - start
-    print(f"Total time: {total_time:.3f}s")
+    print_results(tasks, results, total_time)
     return total_time
 
 
@@ -65,17 +105,56 @@ def run_threaded(tasks: list[int], num_workers: int) -> float:
     start = time.perf_counter()
 
     with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        futures = [executor.submit(cpu_intensive_task, i, n) for i, n in enumerate(tasks)]
-
-        for future in futures:
-            task_id, result, duration = future.result()
-            print(f"Task {task_id}: fib({tasks[task_id]}) = {result} (took {duration:.3f}s)")
+        results = list(executor.map(cpu_intensive_task, range(len(tasks)), tasks))
 
     total_time = time.perf_counter() - start
-    print(f"Total time: {total_time:.3f}s")
+    print_results(tasks, results, total_time)
     return total_time
 
 
+def run_multiprocess(tasks: list[int], num_workers: int) -> float:
+    """Run tasks using a process pool."""
+    print(f"\n=== Multiprocess Execution ({num_workers} workers) ===")
+
+    # Batch tasks per worker process to cut down on IPC round trips
+    chunksize = max(1, len(tasks) // num_workers)
+
+    with ProcessPoolExecutor(
+        max_workers=num_workers, initializer=warm_up, initargs=(tasks,)
+    ) as executor:
+        # Start and warm up every worker before timing: under spawn/forkserver each child
+        # re-imports this module (and rebuilds the c kernel), like the main process did
+        list(executor.map(abs, range(num_workers)))
+
+        start = time.perf_counter()
+        results = list(
+            executor.map(cpu_intensive_task, range(len(tasks)), tasks, chunksize=chunksize)
+        )
+        total_time = time.perf_counter() - start
+
+    print_results(tasks, results, total_time)
+    return total_time
+
+
+def warm_up(tasks: list[int]) -> None:
+    """Run the kernel once outside the timed runs.
+
+    This lets the interpreter specialize the kernel's bytecode and compiles the numba/c
+    kernels (or loads them from cache). The memo table is shared by all workers, so it is
+    filled once rather than charged to whichever run happens to go first.
+    """
+    fibonacci(max(tasks) if FIB_ALGO == "memo" else 20)
+
+
+def print_results(
+    tasks: list[int], results: list[tuple[int, int, float]], total_time: float
+) -> None:
+    """Print per-task results once timing has stopped, so stdout I/O isn't measured."""
+    for task_id, result, duration in results:
+        print(f"Task {task_id}: fib({tasks[task_id]}) = {result} (took {duration:.3f}s)")
+    print(f"Total time: {total_time:.3f}s")
+
+
 def cpu_intensive_task(task_id: int, n: int) -> tuple[int, int, float]:
     """Run a CPU-intensive task and return timing information."""
     start = time.perf_counter()
@@ -85,10 +164,187 @@ def cpu_intensive_task(task_id: int, n: int) -> tuple[int, int, float]:
 
 
 def fibonacci(n: int) -> int:
-    """Compute the nth Fibonacci number (CPU-intensive)."""
+    """Compute the nth Fibonacci number using the algorithm selected by FIB_ALGO."""
+    return FIB_ALGORITHMS[FIB_ALGO](n)
+
+
+def fibonacci_naive(n: int) -> int:
+    """Compute the nth Fibonacci number by naive recursion (CPU-intensive)."""
+    if n <= 1:
+        return n
+    return fibonacci_naive(n - 1) + fibonacci_naive(n - 2)
+
+
+# Shared by all threads. A plain dict rather than functools.cache: on free-threaded
+# builds dict reads don't lock and single writes are atomic, whereas the cache
+# wrapper locks on every call. A racing miss just computes the same value twice.
+_MEMO: dict[int, int] = {}
+
+
+def fibonacci_memo(n: int) -> int:
+    """Compute the nth Fibonacci number by recursion over a shared memo table."""
     if n <= 1:
         return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    result = _MEMO.get(n)
+    if result is None:
+        result = fibonacci_memo(n - 1) + fibonacci_memo(n - 2)
+        _MEMO[n] = result
+    return result
+
+
+def fibonacci_iterative(n: int) -> int:
+    """Compute the nth Fibonacci number with a two-variable loop (no call-stack overhead)."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def fibonacci_lut(n: int) -> int:
+    """Look up the nth Fibonacci number, falling back to fast doubling past the table."""
+    if n < len(_FIB_LUT):
+        return _FIB_LUT[n]
+    return fibonacci_fast(n)
+
+
+# F(0)..F(92): every Fibonacci number that fits in an int64
+_FIB_LUT = [0, 1]
+for _ in range(91):
+    _FIB_LUT.append(_FIB_LUT[-1] + _FIB_LUT[-2])
+
+
+def fibonacci_matrix(n: int) -> int:
+    """Compute the nth Fibonacci number as the top-right entry of [[1, 1], [1, 0]] ** n."""
+    result = (1, 0, 0, 1)
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _mat_mul(result, base)
+        base = _mat_mul(base, base)
+        n >>= 1
+    return result[1]
+
+
+def _mat_mul(x: tuple[int, ...], y: tuple[int, ...]) -> tuple[int, ...]:
+    """Multiply two 2x2 matrices stored row-major as (a, b, c, d)."""
+    a, b, c, d = x
+    e, f, g, h = y
+    return a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h
+
+
+def fibonacci_c(n: int) -> int:
+    """Compute the nth Fibonacci number by naive recursion in C, called via ctypes.
+
+    ctypes releases the GIL for the duration of the call, so threads run in parallel
+    even on standard builds. Uses int64 arithmetic, so results overflow for n > 92.
+    """
+    return _load_fib_c()(n)
+
+
+_FIB_C_SOURCE = """\
+#include <stdint.h>
+int64_t fib(int64_t n) { return n < 2 ? n : fib(n - 1) + fib(n - 2); }
+"""
+
+
+@cache
+def _load_fib_c():
+    """Compile the C kernel into a shared library with the system compiler and load it."""
+    # The loaded library stays mapped after its file is removed, so the build
+    # directory only needs to outlive the CDLL call
+    with tempfile.TemporaryDirectory(prefix="py_freethread_", ignore_cleanup_errors=True) as d:
+        source = os.path.join(d, "fib.c")
+        library = os.path.join(d, "fib.so")
+        with open(source, "w") as f:
+            f.write(_FIB_C_SOURCE)
+        compiler = os.environ.get("CC", "cc")
+        subprocess.run([compiler, "-O3", "-shared", "-fPIC", source, "-o", library], check=True)
+        lib = ctypes.CDLL(library)
+
+    lib.fib.restype = ctypes.c_int64
+    lib.fib.argtypes = [ctypes.c_int64]
+    return lib.fib
+
+
+def fibonacci_repeated(n: int) -> int:
+    """Compute the nth Fibonacci number iteratively, FIB_REPEAT times over.
+
+    Gives a heavy CPU workload whose cost grows linearly with FIB_REPEAT instead of
+    exponentially with n, and that doesn't depend on recursion depth.
+    """
+    a = 0
+    for _ in range(FIB_REPEAT):
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+    return a
+
+
+def fibonacci_fast(n: int) -> int:
+    """Compute the nth Fibonacci number by fast doubling in O(log n) steps."""
+    return _fib_doubling(n)[0]
+
+
+def _fib_doubling(n: int) -> tuple[int, int]:
+    """Return (F(n), F(n+1)) using F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2."""
+    if n < 2:
+        return n, 1
+    a, b = _fib_doubling(n >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    return (d, c + d) if n & 1 else (c, d)
+
+
+# The naive recursion is the default: it is the workload the threading demo is built around.
+FIB_ALGORITHMS = {
+    "naive": fibonacci_naive,
+    "memo": fibonacci_memo,
+    "iterative": fibonacci_iterative,
+    "repeated": fibonacci_repeated,
+    "fast": fibonacci_fast,
+    "matrix": fibonacci_matrix,
+    "lut": fibonacci_lut,
+    "c": fibonacci_c,
+    "aot": _fib_kernel.fibonacci if _fib_kernel is not None else fibonacci_naive,
+}
+if fibonacci_cython is not None:
+    FIB_ALGORITHMS["cython"] = fibonacci_cython
+# Kernels that do measurable work outside the interpreter with the GIL released, so
+# threads can run them in parallel even on standard builds. numba also releases the GIL,
+# but its O(n) int64 loop finishes in nanoseconds, far below the thread pool's overhead.
+GIL_RELEASING_ALGORITHMS = {"c", "cython"}
+FIB_ALGO = os.environ.get("FIB_ALGO", "naive")
+# Repetitions per task for FIB_ALGO=repeated; the default takes roughly 0.5s for n=35
+FIB_REPEAT = int(os.environ.get("FIB_REPEAT", "300000"))
+if FIB_REPEAT < 1:
+    raise ValueError(f"FIB_REPEAT must be at least 1, got {FIB_REPEAT}")
+if FIB_ALGO == "cython" and fibonacci_cython is None:
+    raise ImportError(
+        "FIB_ALGO=cython requires the compiled extension: "
+        "cythonize -i src/py_freethread/_cpu_bound_cy.pyx"
+    )
+if FIB_ALGO == "numba":
+    # Imported only when selected: importing numba is slow. Without an explicit signature
+    # the kernel is compiled (or loaded from cache) on its first call, in the warmup.
+    try:
+        from numba import njit
+    except ImportError as e:
+        raise ImportError("FIB_ALGO=numba requires numba: pip install py-freethread[numba]") from e
+
+    @njit(nogil=True, cache=True)
+    def fibonacci_numba(n):
+        """Compute the nth Fibonacci number in Numba nopython mode, without holding the GIL.
+
+        Uses int64 arithmetic, so results overflow for n > 92.
+        """
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
+
+    FIB_ALGORITHMS["numba"] = fibonacci_numba
+if FIB_ALGO not in FIB_ALGORITHMS:
+    raise ValueError(f"Unknown FIB_ALGO {FIB_ALGO!r}; choose from {', '.join(FIB_ALGORITHMS)}")
 
 
 if __name__ == "__main__":
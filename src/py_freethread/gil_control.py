@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """GIL control and monitoring - check status and measure thread parallelism."""
 
+import math
+import os
 import sys
 import threading
 import time
@@ -50,63 +52,68 @@ def monitor_thread_execution(func, *args, duration: float = 1.0):
     print(f"\n\nMonitoring thread execution for {duration}s...")
     print("=" * 50)
 
-    results = []
-    lock = threading.Lock()
+    # One thread per available CPU (respects affinity/cgroup limits)
+    num_threads = os.process_cpu_count() or 1
+
+    # One slot per thread: each worker writes only its own index, so no lock is needed
+    iterations = [0] * num_threads
+    elapsed = [0.0] * num_threads
+
+    # Workers and the main thread rendezvous here so every thread's timing window
+    # starts at the same moment, regardless of thread spawn latency
+    barrier = threading.Barrier(num_threads + 1)
+
+    # Integer nanoseconds keep float arithmetic out of the polling loop
+    duration_ns = int(duration * 1e9)
 
     def worker(thread_id: int):
-        start = time.perf_counter()
-        iterations = 0
+        barrier.wait()
+        start_ns = time.perf_counter_ns()
+        count = 0
 
-        while time.perf_counter() - start < duration:
+        while time.perf_counter_ns() - start_ns < duration_ns:
             func(*args)
-            iterations += 1
-
-        elapsed = time.perf_counter() - start
+            count += 1
 
-        with lock:
-            results.append(
-                {
-                    "thread_id": thread_id,
-                    "iterations": iterations,
-                    "time": elapsed,
-                    "throughput": iterations / elapsed,
-                }
-            )
+        elapsed[thread_id] = (time.perf_counter_ns() - start_ns) / 1e9
+        iterations[thread_id] = count
 
-    num_threads = 4
     threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
 
-    start_time = time.perf_counter()
     for t in threads:
         t.start()
+    barrier.wait()
+    start_time = time.perf_counter()
     for t in threads:
         t.join()
     total_time = time.perf_counter() - start_time
 
+    throughput = [n / t for n, t in zip(iterations, elapsed)]
+
     # Print results
     print("\nPer-Thread Results:")
-    total_iterations = 0
-    for r in results:
+    for thread_id in range(num_threads):
         print(
-            f"  Thread {r['thread_id']}: "
-            f"{r['iterations']:,} iterations, "
-            f"{r['throughput']:.0f} iter/sec"
+            f"  Thread {thread_id}: "
+            f"{iterations[thread_id]:,} iterations, "
+            f"{throughput[thread_id]:.0f} iter/sec"
         )
-        total_iterations += r["iterations"]
+    total_iterations = sum(iterations)
 
     overall_throughput = total_iterations / total_time
     print(f"\nOverall: {total_iterations:,} iterations, " f"{overall_throughput:.0f} iter/sec")
 
     # Analyze parallelism
-    expected_parallel_throughput = results[0]["throughput"] * num_threads
-    parallelism_ratio = overall_throughput / results[0]["throughput"]
+    parallelism_ratio = overall_throughput / throughput[0]
 
     print(f"\nParallelism Analysis:")
-    print(f"  Single-thread throughput: {results[0]['throughput']:.0f} iter/sec")
+    print(f"  Single-thread throughput: {throughput[0]:.0f} iter/sec")
     print(f"  Multi-thread throughput: {overall_throughput:.0f} iter/sec")
     print(f"  Parallelism factor: {parallelism_ratio:.2f}x")
 
-    if parallelism_ratio > 1.5:
+    if num_threads == 1:
+        print("  ⚠️  Only one CPU available - parallelism cannot be measured")
+    elif parallelism_ratio > 1.5:
         print("  ✓ Threads are executing in parallel!")
     else:
         print("  ⚠️  Limited parallelism (likely due to GIL)")
@@ -131,11 +138,13 @@ def check_gil_status() -> dict:
 
 
 def cpu_intensive_work():
-    """Simple CPU-intensive work for monitoring."""
-    total = 0
-    for i in range(1000):
-        total += i**2
-    return total
+    """Simple CPU-intensive work for monitoring: the sum of i**2 for i in range(1000).
+
+    math.sumprod runs the loop in C (still holding the GIL on standard builds), so the
+    measurement reflects thread scheduling rather than bytecode dispatch.
+    """
+    r = range(1000)
+    return math.sumprod(r, r)
 
 
 if __name__ == "__main__":